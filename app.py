@@ -8,11 +8,10 @@ Entrypoint for local run or Streamlit Cloud:
 
 import streamlit as st
 from pathlib import Path
-import pandas as pd
 import time
 
 # Local imports
-from data_loader import download_dataset, list_dataset_files, load_table
+from data_loader import download_dataset, list_dataset_files, load_view, ArrowView
 from src.analytics import (
     show_overview,
     show_races_dashboard,
@@ -56,15 +55,16 @@ with st.expander("Inspect downloaded dataset files"):
     else:
         st.info("No dataset found yet. Click 'Download / Refresh dataset' in the sidebar.")
 
-# Load commonly used tables lazily
-@st.cache_data(ttl=3600)
-def _load_table_safe(name: str):
+# Load commonly used tables lazily.
+# cache_resource hands every rerun the same memory-mapped Arrow table (no pickling);
+# dashboards convert only the columns they need to pandas.
+@st.cache_resource(ttl=3600, max_entries=8)
+def _load_table_safe(name: str) -> ArrowView:
     try:
-        df = load_table(name)
-        return df
+        return load_view(name)
     except Exception as e:
         st.warning(f"Could not load {name}: {e}")
-        return pd.DataFrame()
+        return ArrowView()
 
 # Example naming — adapt to actual dataset file names
 players = _load_table_safe("players.csv")
@@ -5,16 +5,28 @@ extracting and exposing helper functions to load CSV/parquet files
 into pandas DataFrames.
 
 Usage:
-    from data_loader import download_dataset, list_dataset_files, load_table
+    from data_loader import download_dataset, list_dataset_files, load_table, load_view, iter_batches
 """
 
 import os
 import zipfile
 import glob
+import hashlib
+import fnmatch
+import functools
+import re
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from pathlib import Path
 from typing import Optional
+import numpy as np
 import pandas as pd
 
+from src.utils import infer_hints
+
 # kagglehub import for automatic downloads (user requested)
 try:
     import kagglehub
@@ -22,8 +34,80 @@ except Exception as e:
     kagglehub = None
     # In deployment, ensure kagglehub is installed and configured.
 
+# pyarrow gives a multi-threaded CSV reader and the Parquet cache; pandas is the fallback.
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pa_fs
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
 DATA_DIR = Path("data/raw")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR = DATA_DIR / ".cache"
+# bump when the cache layout / encoding changes so old sidecars are rebuilt
+CACHE_VERSION = 7
+# hive partition columns of time-partitioned caches (<cache>/year=YYYY/month=MM/*.parquet)
+PARTITION_FIELDS = ("year", "month")
+
+# id columns repeated across events (player_id, userId, session_id, ...); stored as pandas categoricals
+KEY_COLUMN_PATTERN = re.compile(r"^(player|user|session|game)_?id$", re.IGNORECASE)
+
+
+def _fast_copy(src: str, dst: str) -> str:
+    """
+    copy_function for shutil.copytree: in-kernel copy (or reflink) via os.copy_file_range,
+    falling back to shutil.copyfile, which uses sendfile on Linux. copy_file_range returning 0
+    before the end (some FUSE / overlay / network filesystems, or a shrinking file) is treated
+    as unsupported rather than leaving a truncated copy.
+    """
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    raise OSError("copy_file_range stopped before the end of the file")
+                remaining -= copied
+    except (AttributeError, OSError):
+        shutil.copyfile(src, dst)
+    return dst
+
+
+def _extract_zip(zip_path: Path, target_dir: Path) -> None:
+    """
+    Extract a zip archive with bsdtar (libarchive, streaming) when it is installed, otherwise
+    decompress members in a thread pool; zlib releases the GIL, so members inflate in parallel.
+    """
+    bsdtar = shutil.which("bsdtar")
+    if bsdtar:
+        subprocess.run([bsdtar, "-C", str(target_dir), "-xf", str(zip_path)], check=True)
+        return
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        names = zf.namelist()
+    # one ZipFile per worker thread, so members are read through independent file handles
+    local, handles = threading.local(), []
+
+    def extract(name):
+        if not hasattr(local, "zf"):
+            local.zf = zipfile.ZipFile(zip_path, "r")
+            handles.append(local.zf)
+        try:
+            local.zf.extract(name, target_dir)
+        except FileExistsError:
+            # two workers raced to create the same parent directory; it exists now
+            local.zf.extract(name, target_dir)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+            list(ex.map(extract, names))
+    finally:
+        for zf in handles:
+            zf.close()
 
 
 def download_dataset(dataset_ref: str = "yogendras843/online-casino-dataset", force: bool = False) -> Path:
@@ -51,24 +135,12 @@ def download_dataset(dataset_ref: str = "yogendras843/online-casino-dataset", fo
     if download_path.is_file() and download_path.suffix in [".zip"]:
         print("Extracting zip to", target_dir)
         target_dir.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(download_path, "r") as zf:
-            zf.extractall(target_dir)
+        _extract_zip(download_path, target_dir)
     elif download_path.is_dir():
         print("Moving downloaded folder to data directory.")
         # Some kagglehub versions return a folder path
-        target_dir.mkdir(parents=True, exist_ok=True)
-        # copy files (non-destructive)
-        for f in download_path.iterdir():
-            dest = target_dir / f.name
-            if not dest.exists():
-                try:
-                    if f.is_dir():
-                        # simple copytree alternative
-                        os.system(f'cp -r "{f}" "{dest}"')
-                    else:
-                        os.system(f'cp "{f}" "{dest}"')
-                except Exception:
-                    pass
+        # copy files (the kagglehub cache is left untouched)
+        shutil.copytree(download_path, target_dir, dirs_exist_ok=True, copy_function=_fast_copy)
     else:
         raise RuntimeError(f"Unexpected download path: {download_path}")
 
@@ -76,6 +148,25 @@ def download_dataset(dataset_ref: str = "yogendras843/online-casino-dataset", fo
     return target_dir
 
 
+def _walk_files(root):
+    """
+    Recursively yield file paths under root, like Path.glob("**/*"): symlinked files are followed,
+    symlinked directories are not descended into, and only the Parquet cache directory is skipped.
+    os.scandir's DirEntry caches the file type from the directory read, so no per-entry stat is needed.
+    """
+    try:
+        it = os.scandir(root)
+    except PermissionError:
+        # unreadable directories are skipped, as pathlib's glob does
+        return
+    with it:
+        for entry in it:
+            if entry.is_file():
+                yield entry.path
+            elif entry.is_dir() and not entry.is_symlink() and os.path.abspath(entry.path) != os.path.abspath(CACHE_DIR):
+                yield from _walk_files(entry.path)
+
+
 def list_dataset_files(data_path: Optional[Path] = None, pattern: str = "**/*") -> list:
     """
     List files in the dataset folder. Useful to inspect what was downloaded.
@@ -83,37 +174,342 @@ def list_dataset_files(data_path: Optional[Path] = None, pattern: str = "**/*")
     data_path = Path(data_path) if data_path else (DATA_DIR / "yogendras843_online-casino-dataset")
     if not data_path.exists():
         # fallback: list any folder under data/raw
-        paths = [p for p in DATA_DIR.iterdir() if p.is_dir()]
+        paths = _dataset_dirs()
         if paths:
             data_path = paths[0]
         else:
             return []
-    files = [p for p in data_path.glob(pattern) if p.is_file()]
-    return [str(p.relative_to(data_path)) for p in files]
+    if not pattern.startswith("**/") or "/" in pattern[3:]:
+        # non-recursive (or multi-level) patterns keep glob semantics
+        return [str(p.relative_to(data_path)) for p in data_path.glob(pattern) if p.is_file()]
+    # "**/<name>": walk once and match the name pattern against file names
+    name_pattern = pattern[3:]
+    files = [f for f in _walk_files(data_path) if fnmatch.fnmatchcase(os.path.basename(f), name_pattern)]
+    return [os.path.relpath(f, data_path) for f in files]
+
+
+def _cache_path(path: Path) -> Path:
+    """
+    Parquet sidecar for a raw file under data/raw/.cache: a single file, or a directory
+    partitioned by year/month when the table has a timestamp column. The name embeds a
+    digest of (path, mtime, size), so edited or re-downloaded files never hit a stale cache.
+    """
+    stat = path.stat()
+    key = f"{stat.st_mtime_ns}:{stat.st_size}:v{CACHE_VERSION}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return CACHE_DIR / f"{_cache_prefix(path)}{digest}.parquet"
+
+
+def _cache_prefix(path: Path) -> str:
+    """
+    File-name prefix shared by every cache of one source file: its stem plus a digest of
+    the resolved path, so files with the same stem in other folders never share it.
+    """
+    source = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:8]
+    return f"{path.stem}.{source}."
+
+
+def _compact_table(table):
+    """
+    Shrink an Arrow table (or record batch) before it reaches pandas: narrow integer key columns
+    to the smallest type that holds their range and dictionary-encode them (Parquet reads them
+    back plain); other integers are narrowed to signed types of at least 32 bits, because
+    arithmetic on ArrowDtype columns is overflow-checked (uint8 stake - payout would raise).
+    Floats are left alone; money columns need float64 precision.
+    """
+    for i, field in enumerate(table.schema):
+        col = table.column(i)
+        if not pa.types.is_integer(field.type) or col.null_count == len(col):
+            continue
+        bounds = pc.min_max(col)
+        lo, hi = bounds["min"].as_py(), bounds["max"].as_py()
+        narrow = np.promote_types(np.min_scalar_type(lo), np.min_scalar_type(hi))
+        is_key = KEY_COLUMN_PATTERN.search(field.name)
+        if not is_key:
+            narrow = np.promote_types(narrow, np.int32)
+        if narrow.kind not in "iu":
+            # uint64 values beyond int64 have no signed type; keep the column as is
+            continue
+        col = col.cast(pa.from_numpy_dtype(narrow))
+        if is_key:
+            col = col.dictionary_encode()
+        table = table.set_column(i, field.name, col)
+    return table
+
+
+def _encode_keys(batch):
+    """
+    Dictionary-encode the string key columns of a CSV record batch before it is cached;
+    Parquet stores them as dictionary pages and reads them back as dictionaries.
+    """
+    for i, field in enumerate(batch.schema):
+        if KEY_COLUMN_PATTERN.search(field.name) and pa.types.is_string(field.type):
+            batch = batch.set_column(i, field.name, batch.column(i).dictionary_encode())
+    return batch
+
+
+def _compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    pandas counterpart of _compact_table for the no-pyarrow fallback.
+    """
+    for c in df.columns:
+        if KEY_COLUMN_PATTERN.search(c):
+            df[c] = df[c].astype("category")
+        elif pd.api.types.is_integer_dtype(df[c]):
+            # signed and at least 32 bits, like _compact_table, so stake - payout cannot wrap
+            narrow = pd.to_numeric(df[c], downcast="integer").dtype
+            df[c] = df[c].astype(np.promote_types(narrow, np.int32))
+    return df
+
+
+def _csv_to_parquet(path: Path, cache: Path) -> None:
+    """
+    Stream a CSV through the threaded Arrow reader into a Parquet cache, one block at a time,
+    so the file is never held in memory whole. open_csv fixes the column types from the first
+    block; when a later block does not fit them (e.g. a column empty for the first rows), the
+    file is re-read whole with read_csv, which infers the types over every row.
+    """
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    # drop caches written for older versions of the same file
+    for stale in cache.parent.glob(f"{glob.escape(_cache_prefix(path))}{'?' * 12}.parquet"):
+        _remove_cache(stale)
+    # write-then-rename so concurrent sessions never read a half-written cache
+    tmp = cache.with_suffix(".tmp")
+    _remove_cache(tmp)
+    try:
+        try:
+            _write_cache(pa_csv.open_csv(path, **_csv_options()), tmp)
+        except pa.ArrowInvalid:
+            _remove_cache(tmp)
+            _write_cache(pa_csv.read_csv(path, **_csv_options()).to_reader(max_chunksize=1 << 20), tmp)
+    except BaseException:
+        _remove_cache(tmp)
+        raise
+    tmp.replace(cache)
+
+
+def _csv_options() -> dict:
+    return dict(
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=64 << 20),
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+    )
+
+
+def _write_cache(reader, tmp: Path) -> None:
+    """
+    Write a stream of CSV record batches to tmp: a single Parquet file, or year=/month=
+    directories when the table has a timestamp column.
+    """
+    schema = pa.schema([
+        pa.field(f.name, pa.dictionary(pa.int32(), f.type))
+        if KEY_COLUMN_PATTERN.search(f.name) and pa.types.is_string(f.type) else f
+        for f in reader.schema
+    ])
+    batches = (_encode_keys(batch) for batch in reader)
+
+    ts_col = infer_hints(schema.names).ts
+    if not ts_col or not pa.types.is_timestamp(schema.field(ts_col).type) \
+            or any(f in schema.names for f in PARTITION_FIELDS):
+        with pq.ParquetWriter(tmp, schema, compression="zstd", use_dictionary=True) as writer:
+            for batch in batches:
+                writer.write_batch(batch, row_group_size=1_000_000)
+    else:
+        # year=/month= directories let window scans skip whole files without opening them
+        schema = schema.append(pa.field("year", pa.int16())).append(pa.field("month", pa.int8()))
+        tmp.mkdir()
+        ds.write_dataset(
+            (_with_partition_columns(batch, ts_col) for batch in batches), tmp,
+            schema=schema, format="parquet", partitioning=_partitioning(),
+            file_options=ds.ParquetFileFormat().make_write_options(compression="zstd", use_dictionary=True),
+            max_rows_per_group=1_000_000, max_partitions=4096, preserve_order=True,
+        )
+
+
+def _with_partition_columns(batch, ts_col: str):
+    ts = batch.column(ts_col)
+    year, month = pc.cast(pc.year(ts), pa.int16()), pc.cast(pc.month(ts), pa.int8())
+    return pa.RecordBatch.from_arrays([*batch.columns, year, month], names=[*batch.schema.names, "year", "month"])
+
+
+def _remove_cache(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _partitioning():
+    return ds.partitioning(pa.schema([("year", pa.int16()), ("month", pa.int8())]), flavor="hive")
+
+
+def _dataset(path: Path):
+    """
+    Memory-mapped pyarrow dataset over a Parquet file or a year/month partitioned cache directory.
+    Discovery lists partitions lexicographically (month=10 before month=2), so the files are
+    re-ordered by (year, month, part) to read rows back in time order.
+    """
+    filesystem = pa_fs.LocalFileSystem(use_mmap=True)
+    if not path.is_dir():
+        return ds.dataset(str(path), format="parquet", filesystem=filesystem)
+    files = sorted(ds.dataset(str(path), format="parquet", filesystem=filesystem).files, key=_partition_order)
+    return ds.dataset(files, format="parquet", partitioning=_partitioning(),
+                      partition_base_dir=str(path), filesystem=filesystem)
+
+
+_PARTITION_FILE = re.compile(r"year=(-?\d+)/month=(\d+)/part-(\d+)\.parquet$")
+
+
+def _partition_order(file: str) -> tuple:
+    # files outside year=/month= directories (null timestamps) sort last
+    match = _PARTITION_FILE.search(file.replace(os.sep, "/"))
+    return (0, *map(int, match.groups())) if match else (1, file)
+
+
+def _source_info(path: Path):
+    """
+    (schema, num_rows) of a Parquet source from its footers, without the partition columns.
+    """
+    if not path.is_dir():
+        return pq.read_schema(path), pq.read_metadata(path).num_rows
+    dataset = _dataset(path)
+    schema = pa.schema([f for f in dataset.schema if f.name not in PARTITION_FIELDS], metadata=dataset.schema.metadata)
+    return schema, dataset.count_rows()
+
+
+def _month_filter(start, end):
+    """
+    Partition predicate for the months from start to end, so the dataset scanner skips
+    whole year=/month= directories outside a time window.
+    """
+    year, month = ds.field("year"), ds.field("month")
+    after = (year > start.year) | ((year == start.year) & (month >= start.month))
+    before = (year < end.year) | ((year == end.year) & (month <= end.month))
+    return after & before
+
+
+def _column_max(path: Path, column: str):
+    """
+    Largest value of a column, from the Parquet footer statistics of the source. A partitioned
+    cache only opens the footers of its newest year=/month= partition; row groups without
+    statistics are scanned.
+    """
+    fragments = list(_dataset(path).get_fragments())
+    if path.is_dir():
+        keys = [ds.get_partition_keys(f.partition_expression) for f in fragments]
+        months = [(k["year"], k["month"]) for k in keys if k.get("year") is not None and k.get("month") is not None]
+        if months:
+            newest = max(months)
+            fragments = [f for f, k in zip(fragments, keys) if (k.get("year"), k.get("month")) == newest]
+    best = None
+    for fragment in fragments:
+        metadata = fragment.metadata
+        index = metadata.schema.to_arrow_schema().get_field_index(column)
+        for rg in range(metadata.num_row_groups):
+            stats = metadata.row_group(rg).column(index).statistics
+            if stats is not None and stats.has_min_max:
+                value = stats.max
+            elif metadata.row_group(rg).num_rows:
+                value = pc.max(fragment.subset(row_group_ids=[rg]).to_table(columns=[column]).column(0)).as_py()
+            else:
+                continue
+            if value is not None and (best is None or value > best):
+                best = value
+    return best
+
+
+# Process-wide Arrow tables, keyed on (path, mtime_ns, columns) and bounded so old file versions
+# and projections are evicted. Tables are memory-mapped, so holding them here keeps the mapping
+# alive for every DataFrame built from them.
+ARROW_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=ARROW_CACHE_SIZE)
+def _read_arrow_cached(path: str, mtime_ns: int, columns: Optional[tuple]):
+    path = Path(path)
+    if path.is_dir():
+        columns = columns if columns is not None else _source_info(path)[0].names
+        return _dataset(path).to_table(columns=list(columns))
+    columns = list(columns) if columns is not None else None
+    return pq.read_table(path, columns=columns, memory_map=True, pre_buffer=False)
+
+
+def _read_arrow(path: Path, columns: Optional[list] = None):
+    """
+    Memory-map the selected columns of a Parquet file (or partitioned cache directory) into
+    a pyarrow Table, memoized until the file changes. Unselected columns are never decoded.
+    """
+    columns = tuple(columns) if columns is not None else None
+    return _read_arrow_cached(str(path), path.stat().st_mtime_ns, columns)
+
+
+def _parquet_source(path: Path) -> Path:
+    """
+    Parquet file (or partitioned cache directory) backing a CSV / parquet file, building the CSV cache if needed.
+    """
+    suffix = path.suffix.lower()
+    if suffix in [".csv", ".txt"]:
+        cache = _cache_path(path)
+        if not cache.exists():
+            _csv_to_parquet(path, cache)
+        return cache
+    if suffix in [".parquet"]:
+        return path
+    raise ValueError(f"Unsupported file type: {path}")
+
+
+def _load_arrow_file(path: Path):
+    """
+    Return a CSV / parquet file as a pyarrow Table, going through the Parquet cache for CSVs.
+    """
+    return _read_arrow(_parquet_source(path))
+
+
+def _arrow_to_pandas(table) -> pd.DataFrame:
+    """
+    Convert a (possibly shared, memory-mapped) Arrow table to an Arrow-backed DataFrame.
+    Integers are narrowed, and dictionary and key columns become pandas categoricals so
+    groupbys run on integer codes.
+    """
+    # cached tables are shared, so they must not be destroyed by the conversion
+    return _compact_table(table).to_pandas(types_mapper=_pandas_dtype, split_blocks=True, self_destruct=False)
+
+
+def _pandas_dtype(arrow_type):
+    # None falls back to pyarrow's default conversion (dictionary -> Categorical)
+    return None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
 
 
 def _auto_read_file(path: Path) -> pd.DataFrame:
     """
     Small helper to read CSV / parquet with sane defaults.
+    CSVs are parsed once with pyarrow and served from a memory-mapped Parquet cache afterwards.
     """
-    if path.suffix.lower() in [".csv", ".txt"]:
-        return pd.read_csv(path, low_memory=False)
-    if path.suffix.lower() in [".parquet"]:
-        return pd.read_parquet(path)
-    raise ValueError(f"Unsupported file type: {path}")
+    if pa is None:
+        if path.suffix.lower() in [".csv", ".txt"]:
+            return _compact_frame(pd.read_csv(path, low_memory=False))
+        if path.suffix.lower() in [".parquet"]:
+            return _compact_frame(pd.read_parquet(path))
+        raise ValueError(f"Unsupported file type: {path}")
+    return _arrow_to_pandas(_load_arrow_file(path))
 
 
-def load_table(filename: str, data_path: Optional[Path] = None) -> pd.DataFrame:
+def _dataset_dirs() -> list:
     """
-    Load a named table from the dataset folder (by file name).
-    Example: load_table('players.csv')
+    Dataset folders under data/raw (hidden folders such as the Parquet cache are skipped).
+    """
+    return [p for p in DATA_DIR.iterdir() if p.is_dir() and not p.name.startswith(".")]
+
+
+def _resolve_path(filename: str, data_path: Optional[Path] = None) -> Path:
+    """
+    Find a named file in the dataset folder: exact name, then recursive, then partial match.
     """
     # discover dataset folder
     if data_path:
         base = Path(data_path)
     else:
         # try to find the only dir under data/raw or a named one
-        candidates = [p for p in DATA_DIR.iterdir() if p.is_dir()]
+        candidates = _dataset_dirs()
         if not candidates:
             raise FileNotFoundError("No dataset found. Call download_dataset() first.")
         # pick the first candidate (if multiple, user can pass data_path)
@@ -122,18 +518,190 @@ def load_table(filename: str, data_path: Optional[Path] = None) -> pd.DataFrame:
     # try direct path or glob
     target = base / filename
     if target.exists():
-        return _auto_read_file(target)
+        return target
 
     # try to find file anywhere under base
-    matches = list(base.glob(f"**/{filename}"))
+    all_files = [Path(f) for f in _walk_files(base)]
+    matches = [p for p in all_files if p.name == filename]
     if matches:
-        return _auto_read_file(matches[0])
+        return matches[0]
 
     # if not exact name, attempt to match by suffix or partial match
-    all_files = list(base.glob("**/*"))
     # find files whose name contains filename string
-    candidates = [p for p in all_files if p.is_file() and filename.lower() in p.name.lower()]
+    candidates = [p for p in all_files if filename.lower() in p.name.lower()]
     if candidates:
-        return _auto_read_file(candidates[0])
+        return candidates[0]
 
     raise FileNotFoundError(f"File {filename} not found in {base}. Available files: {list_dataset_files(base)}")
+
+
+def load_table(filename: str, data_path: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Load a named table from the dataset folder (by file name).
+    Example: load_table('players.csv')
+    """
+    return _auto_read_file(_resolve_path(filename, data_path))
+
+
+def load_arrow_table(filename: str, data_path: Optional[Path] = None):
+    """
+    Like load_table, but returns the cached, memory-mapped pyarrow Table without
+    converting it to pandas.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is not installed. Please `pip install pyarrow`.")
+    return _load_arrow_file(_resolve_path(filename, data_path))
+
+
+def iter_batches(filename: str, columns: Optional[list] = None, batch_size: int = 1 << 20,
+                 data_path: Optional[Path] = None):
+    """
+    Stream a named table as pyarrow RecordBatches without loading it whole, for files
+    larger than memory. Reads the Parquet cache when it exists, otherwise the raw CSV
+    incrementally (batch_size is then the CSV block size in bytes).
+    """
+    if pa is None:
+        raise ImportError("pyarrow is not installed. Please `pip install pyarrow`.")
+    path = _resolve_path(filename, data_path)
+    if path.suffix.lower() in [".csv", ".txt"]:
+        cache = _cache_path(path)
+        if not cache.exists():
+            return iter(pa_csv.open_csv(
+                path,
+                read_options=pa_csv.ReadOptions(block_size=batch_size),
+                convert_options=pa_csv.ConvertOptions(include_columns=columns, strings_can_be_null=True),
+            ))
+        path = cache
+    return ArrowView(source=path).iter_batches(columns, batch_size=batch_size)
+
+
+def load_view(filename: str, data_path: Optional[Path] = None) -> "ArrowView":
+    """
+    Open a named table as an ArrowView over its Parquet source. Only the footer is read
+    here; the memory-mapped table is loaded on first use.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is not installed. Please `pip install pyarrow`.")
+    return ArrowView(source=_parquet_source(_resolve_path(filename, data_path)))
+
+
+class ArrowView:
+    """
+    Read-only handle over a cached Arrow table, passed to the dashboards instead of a DataFrame.
+    Exposes the cheap DataFrame attributes (columns, shape, empty); call to_pandas() with the
+    columns a dashboard actually uses to materialize only those, or iter_batches() / iter_window()
+    to stream tables that should not be materialized at all.
+    `hints` carries the detected column names (src.utils.SchemaHints) computed at load time;
+    `source` is the backing Parquet file or partitioned directory, used for filtered and streamed reads.
+    """
+
+    def __init__(self, table=None, hints=None, source: Optional[Path] = None):
+        self._table = table
+        self.source = source
+        if table is not None:
+            self.schema, self.num_rows = table.schema, table.num_rows
+        elif source is not None:
+            self.schema, self.num_rows = _source_info(source)
+        else:
+            self.schema, self.num_rows = None, 0
+        self.hints = hints if hints is not None else infer_hints(self.columns)
+
+    @property
+    def table(self):
+        """
+        The full memory-mapped table, loaded on first access.
+        """
+        return self.to_arrow()
+
+    @property
+    def columns(self) -> list:
+        return list(self.schema.names) if self.schema is not None else []
+
+    @property
+    def shape(self) -> tuple:
+        return (self.num_rows, len(self.columns))
+
+    @property
+    def empty(self) -> bool:
+        return self.shape[0] == 0 or self.shape[1] == 0
+
+    @staticmethod
+    def _select(columns: Optional[list]) -> Optional[list]:
+        # missing (None) entries and duplicates are ignored
+        return list(dict.fromkeys(c for c in columns if c)) if columns is not None else None
+
+    def to_arrow(self, columns: Optional[list] = None):
+        """
+        The selected columns as a pyarrow Table; with a Parquet source only those columns are read.
+        Missing (None) entries and duplicates are ignored.
+        """
+        columns = self._select(columns)
+        if self.source is not None:
+            return _read_arrow(self.source, columns)
+        if self._table is None:
+            return None
+        return self._table.select(columns) if columns is not None else self._table
+
+    def to_pandas(self, columns: Optional[list] = None) -> pd.DataFrame:
+        """
+        Convert the selected columns to pandas. Missing (None) entries and duplicates are ignored.
+        """
+        table = self.to_arrow(columns)
+        if table is None:
+            return pd.DataFrame(columns=self._select(columns))
+        return _arrow_to_pandas(table)
+
+    def iter_batches(self, columns: Optional[list] = None, filter=None, batch_size: int = 1 << 20):
+        """
+        Stream the selected columns as pyarrow RecordBatches, optionally filtered with a
+        pyarrow.dataset expression. Streams from the Parquet source when there is one.
+        """
+        columns = self._select(columns)
+        if self.source is None:
+            if self._table is None:
+                return
+            table = self._table.select(columns) if columns is not None else self._table
+            if filter is not None:
+                table = table.filter(filter)
+            yield from table.to_batches(max_chunksize=batch_size)
+        elif filter is None and not self.source.is_dir():
+            yield from pq.ParquetFile(self.source, memory_map=True).iter_batches(batch_size=batch_size, columns=columns)
+        else:
+            # the dataset scanner skips partitions and row groups that cannot match the filter
+            dataset = _dataset(self.source)
+            yield from dataset.to_batches(columns=columns or self.columns, filter=filter, batch_size=batch_size)
+
+    def iter_frames(self, columns: Optional[list] = None, filter=None, batch_size: int = 1 << 20):
+        """
+        Like iter_batches, but yields each batch converted to pandas.
+        """
+        for batch in self.iter_batches(columns, filter, batch_size):
+            yield _arrow_to_pandas(batch)
+
+    def iter_window(self, columns: list, ts_col: str, days: int, batch_size: int = 1 << 20):
+        """
+        Yield DataFrame batches of the rows within `days` of the latest `ts_col` value.
+        Timestamp columns are filtered inside the dataset scan, so partitions and row groups
+        outside the window are never decoded; other columns are parsed and masked in pandas in one piece.
+        """
+        columns = self._select([ts_col, *columns])
+        if self.empty:
+            return
+        if not pa.types.is_timestamp(self.schema.field(ts_col).type):
+            df = self.to_pandas(columns)
+            df[ts_col] = pd.to_datetime(df[ts_col], errors="coerce")
+            end = df[ts_col].max()
+            yield df[(df[ts_col] >= end - pd.Timedelta(days=days)) & (df[ts_col] <= end)]
+            return
+
+        if self.source is not None:
+            end = _column_max(self.source, ts_col)
+        else:
+            end = pc.max(self._table.column(ts_col)).as_py()
+        if end is None:
+            return
+        start = end - timedelta(days=days)
+        window = (ds.field(ts_col) >= start) & (ds.field(ts_col) <= end)
+        if self.source is not None and self.source.is_dir():
+            window = window & _month_filter(start, end)
+        yield from self.iter_frames(columns, window, batch_size)
@@ -11,8 +11,24 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
+import pyarrow as pa
+import pyarrow.compute as pc
 from datetime import timedelta
 
+from data_loader import ArrowView
+
+# Polars runs the heavier aggregations as fused, multi-threaded lazy queries; pandas is the fallback.
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# numba JIT-compiles the per-player accumulation loop; numpy bincount is the fallback.
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # ---------- Utility plotting helpers ----------
 def _small_kpis(df: pd.DataFrame, label: str, column: str):
     if df is None or df.empty:
@@ -20,8 +36,53 @@ def _small_kpis(df: pd.DataFrame, label: str, column: str):
     val = df[column].sum() if column in df.columns else len(df)
     return val
 
+def _fold_player_totals(frames, player_col: str, value_cols: list) -> pd.DataFrame:
+    """
+    Per-player row count ("count") and sums of value_cols, folded over an iterable of
+    DataFrame batches so only one batch and the running partial aggregates are held in memory.
+    """
+    def combine(parts):
+        return pd.concat(parts).groupby(level=0, sort=False, observed=True).sum()
+
+    partials = []
+    for frame in frames:
+        g = frame.groupby(player_col, sort=False, observed=True)
+        part = g[value_cols].sum()
+        part["count"] = g.size()
+        partials.append(part)
+        if len(partials) >= 16:
+            partials = [combine(partials)]
+    if not partials:
+        return pd.DataFrame(columns=[*value_cols, "count"], index=pd.Index([], name=player_col))
+    return combine(partials)
+
+def _view_key(view: ArrowView):
+    """
+    Cache key for figures built from a view: its Parquet source and that file's mtime, so a
+    rebuilt cache invalidates the figure without reading any table data.
+    """
+    if view.source is None:
+        return id(view)
+    return (str(view.source), view.source.stat().st_mtime_ns)
+
+
 # ---------- OVERVIEW ----------
-def show_overview(players: pd.DataFrame, transactions: pd.DataFrame, bets: pd.DataFrame, sessions: pd.DataFrame):
+@st.cache_resource(max_entries=16)
+def _bets_per_day_fig(key, ts_col: str, _bets: ArrowView):
+    """
+    Bets-per-day line chart, cached on the view key so reruns skip the scan and figure build.
+    Daily counts are folded over streamed batches of the timestamp column alone.
+    """
+    parts = []
+    for frame in _bets.iter_frames([ts_col]):
+        parts.append(pd.to_datetime(frame[ts_col], errors="coerce").dt.floor("D").value_counts())
+    counts = pd.concat(parts).groupby(level=0).sum() if parts else pd.Series(dtype="int64")
+    counts.index = pd.DatetimeIndex(counts.index, name=ts_col)
+    ts = counts.sort_index().asfreq("D", fill_value=0).rename("bets_count").reset_index()
+    return px.line(ts, x=ts_col, y="bets_count", title="Bets per day")
+
+
+def show_overview(players: ArrowView, transactions: ArrowView, bets: ArrowView, sessions: ArrowView):
     """
     High-level KPIs and time-series trends.
     """
@@ -39,13 +100,10 @@ def show_overview(players: pd.DataFrame, transactions: pd.DataFrame, bets: pd.Da
     st.markdown("### Time-series (example)")
     # attempt to find a date column in bets/transactions
     if bets is not None and not bets.empty:
-        date_col = next((c for c in bets.columns if "date" in c.lower() or "time" in c.lower()), None)
+        date_col = bets.hints.ts
         if date_col:
             try:
-                bets_copy = bets.copy()
-                bets_copy[date_col] = pd.to_datetime(bets_copy[date_col], errors="coerce")
-                ts = bets_copy.set_index(date_col).resample("D").size().rename("bets_count").reset_index()
-                fig = px.line(ts, x=date_col, y="bets_count", title="Bets per day")
+                fig = _bets_per_day_fig(_view_key(bets), date_col, bets)
                 st.plotly_chart(fig, use_container_width=True)
             except Exception as e:
                 st.write("Could not render time-series:", e)
@@ -56,18 +114,48 @@ def show_overview(players: pd.DataFrame, transactions: pd.DataFrame, bets: pd.Da
 
     st.markdown("### Quick segmentation example: top players by total wager")
     if transactions is not None and not transactions.empty:
-        # heuristic column names
-        player_col = next((c for c in transactions.columns if "player" in c.lower() or "user" in c.lower()), None)
-        amount_col = next((c for c in transactions.columns if "amount" in c.lower() or "wager" in c.lower() or "bet" in c.lower()), None)
+        # column names detected at load time (src.utils.infer_hints)
+        player_col = transactions.hints.player
+        amount_col = transactions.hints.amount
         if player_col and amount_col:
-            agg = transactions.groupby(player_col)[amount_col].sum().reset_index().sort_values(amount_col, ascending=False).head(20)
+            agg = transactions.to_pandas([player_col, amount_col]).groupby(player_col, observed=True)[amount_col].sum().reset_index().sort_values(amount_col, ascending=False).head(20)
             st.dataframe(agg)
         else:
             st.info("transactions table needs columns like player/user and amount for this example.")
 
 
 # ---------- RACES / LEADERBOARDS ----------
-def show_races_dashboard(bets: pd.DataFrame, transactions: pd.DataFrame, players: pd.DataFrame):
+def _race_leaderboard(frames, player_col: str, metric_col: str, label: str, top_n: int) -> pd.DataFrame:
+    """
+    Top players by the summed metric over streamed batches. With polars, each batch is
+    pre-aggregated and the merge + top_k (a partial sort) runs as one lazy query.
+    Bets without a player are left out, as in the pandas groupby.
+    """
+    if pl is None:
+        totals = _fold_player_totals(frames, player_col, [metric_col])
+        return totals[metric_col].nlargest(top_n).rename(label).reset_index()
+
+    # a shared string cache keeps per-batch categoricals compatible when concatenated
+    with pl.StringCache():
+        partials = [
+            pl.from_pandas(frame[[player_col, metric_col]])
+            .drop_nulls(player_col)
+            .group_by(player_col).agg(pl.col(metric_col).sum().alias(label))
+            for frame in frames
+        ]
+        if not partials:
+            return pd.DataFrame(columns=[player_col, label])
+        leaderboard = (
+            pl.concat(partials).lazy()
+            .group_by(player_col).agg(pl.col(label).sum())
+            .top_k(top_n, by=label)
+            .sort(label, descending=True)
+            .collect()
+        )
+    return leaderboard.to_pandas()
+
+
+def show_races_dashboard(bets: ArrowView, transactions: ArrowView, players: ArrowView):
     """
     Focused tooling to understand races/leaderboards:
     - simulate a leaderboard by total wager or net wins during a time window
@@ -79,15 +167,15 @@ def show_races_dashboard(bets: pd.DataFrame, transactions: pd.DataFrame, players
         st.info("No bets table available to analyze races.")
         return
 
-    # find timestamp and player/wager columns heuristically
-    ts_col = next((c for c in bets.columns if "date" in c.lower() or "time" in c.lower()), None)
-    player_col = next((c for c in bets.columns if "player" in c.lower() or "user" in c.lower()), None)
-    stake_col = next((c for c in bets.columns if "stake" in c.lower() or "amount" in c.lower() or "wager" in c.lower()), None)
-    profit_col = next((c for c in bets.columns if "profit" in c.lower() or "win" in c.lower() or "pnl" in c.lower()), None)
+    # timestamp and player/wager columns detected at load time
+    ts_col = bets.hints.ts
+    player_col = bets.hints.player
+    stake_col = bets.hints.stake
+    profit_col = bets.hints.profit
 
     if not player_col or not stake_col:
         st.warning("Could not find player/wager columns in bets table. Please adjust column names or inspect the dataset.")
-        st.write("Available columns:", bets.columns.tolist())
+        st.write("Available columns:", bets.columns)
         return
 
     # Time window controls
@@ -99,67 +187,171 @@ def show_races_dashboard(bets: pd.DataFrame, transactions: pd.DataFrame, players
         submitted = st.form_submit_button("Compute leaderboard")
 
     if submitted:
-        df = bets.copy()
+        metric_col, label = (stake_col, "total_wager") if scoring == "Total Wager" else (profit_col, "net_profit")
+        if not metric_col:
+            st.warning("Net Profit metric not available in bets table. Choose Total Wager instead.")
+            return
+        # stream the in-window bets; only the player and metric columns are read
         if ts_col:
-            df[ts_col] = pd.to_datetime(df[ts_col], errors="coerce")
-            end = df[ts_col].max()
-            start = end - pd.Timedelta(days=int(window_days))
-            df = df[(df[ts_col] >= start) & (df[ts_col] <= end)]
-        # compute metrics
-        if scoring == "Total Wager":
-            leaderboard = df.groupby(player_col)[stake_col].sum().reset_index().rename(columns={stake_col: "total_wager"})
-            leaderboard = leaderboard.sort_values("total_wager", ascending=False).head(int(top_n))
-            st.subheader("Leaderboard — Total Wager")
-            st.dataframe(leaderboard)
-            fig = px.bar(leaderboard, x=player_col, y="total_wager", title="Top players by total wager")
-            st.plotly_chart(fig, use_container_width=True)
+            frames = bets.iter_window([player_col, metric_col], ts_col, int(window_days))
         else:
-            if profit_col:
-                leaderboard = df.groupby(player_col)[profit_col].sum().reset_index().rename(columns={profit_col: "net_profit"})
-                leaderboard = leaderboard.sort_values("net_profit", ascending=False).head(int(top_n))
-                st.subheader("Leaderboard — Net Profit")
-                st.dataframe(leaderboard)
-                fig = px.bar(leaderboard, x=player_col, y="net_profit", title="Top players by net profit")
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.warning("Net Profit metric not available in bets table. Choose Total Wager instead.")
+            frames = bets.iter_frames([player_col, metric_col])
+        leaderboard = _race_leaderboard(frames, player_col, metric_col, label, int(top_n))
+        st.subheader(f"Leaderboard — {scoring}")
+        st.dataframe(leaderboard)
+        fig = px.bar(leaderboard, x=player_col, y=label, title=f"Top players by {scoring.lower()}")
+        st.plotly_chart(fig, use_container_width=True)
 
 
 # ---------- RETENTION & CHURN ----------
-def show_retention_dashboard(sessions: pd.DataFrame, players: pd.DataFrame):
+def _session_days(sessions: ArrowView, ts_col: str, player_col: str):
+    """
+    Arrow table of (player, date) per session, with the day computed by Arrow compute
+    kernels (floor_temporal + cast) instead of pandas .dt accessors.
+    """
+    table = sessions.to_arrow([player_col, ts_col])
+    ts = table.column(ts_col)
+    if not pa.types.is_timestamp(ts.type):
+        ts = pa.chunked_array([pa.array(pd.to_datetime(ts.to_pandas(), errors="coerce"))])
+    date = pc.cast(pc.floor_temporal(ts, unit="day"), pa.date32())
+    return pa.table({player_col: table.column(player_col), "date": date}).drop_null()
+
+
+def _retention_tables(days, player_col: str):
+    """
+    Daily active users and unique players per (first_date, days_since_first) cohort cell,
+    from a (player, date) Arrow table. Runs as a single lazy Polars query when polars is
+    installed, with Arrow group_by / join kernels otherwise.
+    """
+    if pl is None:
+        player = days.column(player_col)
+        if pa.types.is_dictionary(player.type):
+            # Arrow hash joins need plain keys
+            days = days.set_column(0, player_col, pc.cast(player, player.type.value_type))
+        distinct = f"{player_col}_count_distinct"
+        dau = (days.group_by("date").aggregate([(player_col, "count_distinct")])
+               .select(["date", distinct]).rename_columns(["date", "dau"]).sort_by("date"))
+        # Cohort example: compute retention by cohort creation date
+        first = days.group_by(player_col).aggregate([("date", "min")])
+        merged = days.join(first, player_col)
+        merged = merged.append_column("days_since_first", pc.days_between(merged.column("date_min"), merged.column("date")))
+        cohort = (merged.group_by(["date_min", "days_since_first"]).aggregate([(player_col, "count_distinct")])
+                  .select(["date_min", "days_since_first", distinct])
+                  .rename_columns(["first_date", "days_since_first", player_col]))
+        return dau.to_pandas(date_as_object=False), cohort.to_pandas(date_as_object=False)
+
+    lf = pl.from_arrow(days).lazy()
+    dau = lf.group_by("date").agg(pl.col(player_col).n_unique().alias("dau")).sort("date")
+    first = lf.group_by(player_col).agg(pl.col("date").min().alias("first_date"))
+    cohort = (
+        lf.join(first, on=player_col)
+        .with_columns((pl.col("date") - pl.col("first_date")).dt.total_days().alias("days_since_first"))
+        .group_by(["first_date", "days_since_first"])
+        .agg(pl.col(player_col).n_unique())
+    )
+    # collect_all shares the common scan between both queries
+    dau, cohort = pl.collect_all([dau, cohort])
+    return dau.to_pandas(), cohort.to_pandas()
+
+
+def show_retention_dashboard(sessions: ArrowView, players: ArrowView):
     st.header("Retention & Churn")
     if sessions is None or sessions.empty:
         st.info("Sessions table not available.")
         return
     # find session timestamp and player
-    ts_col = next((c for c in sessions.columns if "date" in c.lower() or "time" in c.lower()), None)
-    player_col = next((c for c in sessions.columns if "player" in c.lower() or "user" in c.lower()), None)
+    ts_col = sessions.hints.ts
+    player_col = sessions.hints.player
     if not ts_col or not player_col:
-        st.warning("Sessions table is missing expected columns. Columns found: " + ", ".join(sessions.columns.tolist()))
+        st.warning("Sessions table is missing expected columns. Columns found: " + ", ".join(sessions.columns))
         return
 
-    sessions_copy = sessions.copy()
-    sessions_copy[ts_col] = pd.to_datetime(sessions_copy[ts_col], errors="coerce")
-    sessions_copy["date"] = sessions_copy[ts_col].dt.normalize()
+    dau, cohort = _retention_tables(_session_days(sessions, ts_col, player_col), player_col)
 
     # simple daily active users (DAU) trend
-    dau = sessions_copy.groupby("date")[player_col].nunique().reset_index().rename(columns={player_col: "dau"})
     fig = px.line(dau, x="date", y="dau", title="Daily Active Users (DAU)")
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("### Simple cohort retention (first session cohorts)")
-    # Cohort example: compute 7-day retention by cohort creation date
-    first = sessions_copy.groupby(player_col)["date"].min().reset_index().rename(columns={"date": "first_date"})
-    merged = sessions_copy.merge(first, on=player_col, how="left")
-    merged["days_since_first"] = (merged["date"] - merged["first_date"]).dt.days
-    cohort = merged.groupby(["first_date", "days_since_first"])[player_col].nunique().reset_index()
     # pivot for simple heatmap
     pivot = cohort.pivot(index="first_date", columns="days_since_first", values=player_col).fillna(0)
     st.dataframe(pivot.head(20))
 
 
 # ---------- FRAUD DETECTION ----------
-def show_fraud_dashboard(bets: pd.DataFrame, transactions: pd.DataFrame, players: pd.DataFrame, sessions: pd.DataFrame):
+# columns of the per-player accumulator filled by _accumulate_stakes
+STAKE_STATS = ["count", "n_stake", "sum", "sumsq"]
+
+
+def _accumulate_stakes_py(codes: np.ndarray, stakes: np.ndarray, out: np.ndarray) -> None:
+    """
+    out[code] += (1, 1, stake, stake**2) for every row; negative codes (missing player) are skipped
+    and missing stakes count as bets without adding to the stake count or sums.
+    """
+    keep = codes >= 0
+    codes, stakes = codes[keep], stakes[keep]
+    valid = ~np.isnan(stakes)
+    stakes = np.where(valid, stakes, 0.0)
+    n = out.shape[0]
+    out[:, 0] += np.bincount(codes, minlength=n)
+    out[:, 1] += np.bincount(codes, weights=valid, minlength=n)
+    out[:, 2] += np.bincount(codes, weights=stakes, minlength=n)
+    out[:, 3] += np.bincount(codes, weights=stakes * stakes, minlength=n)
+
+
+if numba is not None:
+    # serial on purpose: a prange loop would race on out[code] when one player repeats in a batch
+    @numba.njit(cache=True)
+    def _accumulate_stakes(codes, stakes, out):
+        for i in range(codes.size):
+            c = codes[i]
+            if c < 0:
+                continue
+            out[c, 0] += 1.0
+            s = stakes[i]
+            if s == s:
+                out[c, 1] += 1.0
+                out[c, 2] += s
+                out[c, 3] += s * s
+else:
+    _accumulate_stakes = _accumulate_stakes_py
+
+
+def _player_stake_stats(batches, player_col: str, stake_col: str) -> pd.DataFrame:
+    """
+    Per-player bet count, non-missing stake count, stake sum and stake sum of squares over
+    streamed Arrow batches. Each batch's player dictionary is mapped onto one growing set of
+    global codes, and the rows are folded into a preallocated (n_players, 4) array by _accumulate_stakes.
+    """
+    keys, out = None, np.zeros((1024, len(STAKE_STATS)))
+    for batch in batches:
+        player = batch.column(player_col)
+        if not pa.types.is_dictionary(player.type):
+            player = player.dictionary_encode()
+        dictionary = player.dictionary.to_pandas()
+        if keys is None:
+            keys, remap = pd.Index(dictionary), np.arange(len(dictionary))
+        else:
+            remap = keys.get_indexer(dictionary)
+            new = remap < 0
+            if new.any():
+                remap[new] = np.arange(len(keys), len(keys) + new.sum())
+                keys = keys.append(pd.Index(dictionary[new]))
+        if len(keys) > out.shape[0]:
+            out = np.vstack([out, np.zeros((max(len(keys), 2 * out.shape[0]) - out.shape[0], len(STAKE_STATS)))])
+        # append -1 so missing players (null index -> -1) stay negative after remapping
+        remap = np.append(remap, -1)
+        codes = remap[pc.fill_null(player.indices, -1).to_numpy(zero_copy_only=False)]
+        stakes = pc.cast(batch.column(stake_col), pa.float64()).to_numpy(zero_copy_only=False)
+        _accumulate_stakes(codes, stakes, out)
+
+    if keys is None:
+        return pd.DataFrame(columns=STAKE_STATS, index=pd.Index([], name=player_col))
+    stats = pd.DataFrame(out[:len(keys)], columns=STAKE_STATS, index=keys.rename(player_col))
+    return stats[stats["count"] > 0]
+
+
+def show_fraud_dashboard(bets: ArrowView, transactions: ArrowView, players: ArrowView, sessions: ArrowView):
     st.header("Fraud Detection & Risk Signals")
     st.markdown("This page shows simple heuristics for fraud / bot signals.")
     # Heuristic examples: extremely high wager rates, impossible RTPs, suspicious session patterns
@@ -167,35 +359,50 @@ def show_fraud_dashboard(bets: pd.DataFrame, transactions: pd.DataFrame, players
         st.info("Bets table not available.")
         return
 
-    player_col = next((c for c in bets.columns if "player" in c.lower() or "user" in c.lower()), None)
-    stake_col = next((c for c in bets.columns if "stake" in c.lower() or "amount" in c.lower()), None)
-    ts_col = next((c for c in bets.columns if "date" in c.lower() or "time" in c.lower()), None)
+    player_col = bets.hints.player
+    stake_col = bets.hints.stake
 
     if not player_col or not stake_col:
         st.warning("Bets table missing expected columns.")
-        st.write("Columns:", bets.columns.tolist())
+        st.write("Columns:", bets.columns)
         return
 
-    df = bets.copy()
-    if ts_col:
-        df[ts_col] = pd.to_datetime(df[ts_col], errors="coerce")
-        df["hour"] = df[ts_col].dt.hour
+    # one streamed pass for both signals; nlargest selects the top tail without sorting everything
+    stats = _player_stake_stats(bets.iter_batches([player_col, stake_col]), player_col, stake_col)
+    # the stake mean and spread are over non-missing stakes, like Series.mean()
+    avg_stake = stats["sum"] / stats["n_stake"]
+    per_player = pd.DataFrame({
+        "bet_count": stats["count"].astype("int64"),
+        "avg_stake": avg_stake,
+        "stake_std": np.sqrt((stats["sumsq"] / stats["n_stake"] - avg_stake ** 2).clip(lower=0)),
+    })
+    n_players = len(per_player)
 
     # 1) players with unusually high bet frequency per hour
-    freq = df.groupby(player_col).size().reset_index(name="bet_count")
-    suspicious_freq = freq[freq["bet_count"] > freq["bet_count"].quantile(0.99)]
-    st.subheader("High-frequency bettors (99th percentile)")
-    st.dataframe(suspicious_freq.head(50))
+    suspicious_freq = per_player.nlargest(max(50, int(0.01 * n_players)), "bet_count")
+    st.subheader("High-frequency bettors (top 1%)")
+    st.dataframe(suspicious_freq[["bet_count"]].reset_index().head(50))
 
     # 2) players with extreme average stake (possible whales or abuse)
-    avg_stake = df.groupby(player_col)[stake_col].mean().reset_index().rename(columns={stake_col: "avg_stake"})
-    suspicious_stake = avg_stake[avg_stake["avg_stake"] > avg_stake["avg_stake"].quantile(0.995)]
+    suspicious_stake = per_player.nlargest(max(50, int(0.005 * n_players)), "avg_stake")
     st.subheader("Extreme average stake (top 0.5%)")
-    st.dataframe(suspicious_stake.head(50))
+    st.dataframe(suspicious_stake[["avg_stake", "stake_std"]].reset_index().head(50))
 
 
 # ---------- SEGMENTATION & LTV ----------
-def show_segmentation_dashboard(players: pd.DataFrame, transactions: pd.DataFrame, bets: pd.DataFrame):
+def _score(vals: np.ndarray, ascending: bool = True) -> np.ndarray:
+    """
+    Quartile score (1-4) per value as int8: one quantile pass plus a binary search, with no
+    Categorical in between and no failure on duplicate bin edges. ascending=False gives the
+    lowest values the highest score.
+    """
+    q = np.nanquantile(vals, [0.25, 0.5, 0.75])
+    # side="left" keeps a heavy low tie (e.g. many one-bet players) in the bottom bucket
+    s = np.searchsorted(q, vals, side="left").astype(np.int8) + 1
+    return s if ascending else (5 - s)
+
+
+def show_segmentation_dashboard(players: ArrowView, transactions: ArrowView, bets: ArrowView):
     st.header("Segmentation & LTV")
     st.markdown("RFM style segmentation and simple LTV proxies.")
 
@@ -208,38 +415,41 @@ def show_segmentation_dashboard(players: pd.DataFrame, transactions: pd.DataFram
         st.info("Transactions table missing.")
         return
 
-    # heuristics for column names
-    player_col = next((c for c in transactions.columns if "player" in c.lower() or "user" in c.lower()), None)
-    amount_col = next((c for c in transactions.columns if "amount" in c.lower() or "value" in c.lower() or "wager" in c.lower()), None)
-    date_col = next((c for c in transactions.columns if "date" in c.lower() or "time" in c.lower()), None)
+    # column names detected at load time
+    player_col = transactions.hints.player
+    amount_col = transactions.hints.amount
+    date_col = transactions.hints.ts
 
     if not player_col or not amount_col or not date_col:
         st.warning("Transactions table needs player/user, amount and date columns.")
-        st.write("Columns available:", transactions.columns.tolist())
+        st.write("Columns available:", transactions.columns)
         return
 
-    tx = transactions.copy()
+    tx = transactions.to_pandas([player_col, amount_col, date_col])
     tx[date_col] = pd.to_datetime(tx[date_col], errors="coerce")
     snapshot_date = tx[date_col].max() + pd.Timedelta(days=1)
-    rfm = tx.groupby(player_col).agg({
-        date_col: lambda x: (snapshot_date - x.max()).days,
-        amount_col: ["sum", "count"]
-    })
-    rfm.columns = ["recency", "monetary", "frequency"]
-    rfm = rfm.reset_index()
+    # vectorized named aggregations; recency is one vector subtraction afterwards
+    rfm = tx.groupby(player_col, sort=False, observed=True).agg(
+        last_date=(date_col, "max"),
+        monetary=(amount_col, "sum"),
+        frequency=(amount_col, "count"),
+    )
+    rfm["recency"] = (snapshot_date - rfm["last_date"]).dt.days
+    rfm = rfm.drop(columns="last_date").reset_index()
 
     # simple quantile binning
-    rfm["r_score"] = pd.qcut(rfm["recency"], q=4, labels=[4,3,2,1])  # lower recency => higher score
-    rfm["f_score"] = pd.qcut(rfm["frequency"].rank(method="first"), q=4, labels=[1,2,3,4])
-    rfm["m_score"] = pd.qcut(rfm["monetary"].rank(method="first"), q=4, labels=[1,2,3,4])
-    rfm["rfm_score"] = rfm["r_score"].astype(int) * 100 + rfm["f_score"].astype(int) * 10 + rfm["m_score"].astype(int)
+    r = _score(rfm["recency"].to_numpy(dtype="float64", na_value=np.nan), ascending=False)  # lower recency => higher score
+    f = _score(rfm["frequency"].to_numpy(dtype="float64", na_value=np.nan))
+    m = _score(rfm["monetary"].to_numpy(dtype="float64", na_value=np.nan))
+    rfm["r_score"], rfm["f_score"], rfm["m_score"] = r, f, m
+    rfm["rfm_score"] = r.astype(np.int16) * 100 + f.astype(np.int16) * 10 + m
 
     st.subheader("RFM sample (top 20)")
     st.dataframe(rfm.sort_values("monetary", ascending=False).head(20))
 
 
 # ---------- EXPERIMENTS / A/B ----------
-def show_experiments_dashboard(transactions: pd.DataFrame, bets: pd.DataFrame, players: pd.DataFrame):
+def show_experiments_dashboard(transactions: ArrowView, bets: ArrowView, players: ArrowView):
     st.header("Experiments & A/B Testing")
     st.markdown("Tools to analyze experiment outcomes (promotions, races, prizes).")
     st.markdown(
@@ -247,12 +457,11 @@ def show_experiments_dashboard(transactions: pd.DataFrame, bets: pd.DataFrame, p
     )
 
     # sample: basic conversion table if experiment_id exists in players or transactions
-    exp_col = next((c for c in transactions.columns if "experiment" in c.lower() or "exp_id" in c.lower()), None)
-    player_col = next((c for c in transactions.columns if "player" in c.lower() or "user" in c.lower()), None)
-    amount_col = next((c for c in transactions.columns if "amount" in c.lower()), None)
+    exp_col = transactions.hints.experiment
+    player_col = transactions.hints.player
 
     if exp_col and player_col:
-        conv = transactions.groupby([exp_col, player_col]).size().reset_index(name="events")
+        conv = transactions.to_pandas([exp_col, player_col]).groupby([exp_col, player_col], observed=True).size().reset_index(name="events")
         summary = conv.groupby(exp_col)["events"].agg(['count', 'sum']).reset_index().rename(columns={'count': 'unique_players', 'sum': 'total_events'})
         st.dataframe(summary)
     else:
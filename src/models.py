@@ -9,32 +9,46 @@ Placeholders for modeling pipelines:
 Fill in with domain-specific feature engineering and model persistence.
 """
 
+from pathlib import Path
 from typing import Tuple
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingClassifier, HistGradientBoostingRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import roc_auc_score, mean_squared_error
 import joblib
 
-def churn_model_train(X: pd.DataFrame, y: pd.Series, output_path: str = "models/churn_rf.joblib") -> Tuple[object, dict]:
+def _save_model(model, output_path: str) -> None:
     """
-    Train a simple RandomForest for churn prediction.
-    Returns (model, metrics).
+    Persist a model with LZ4 compression (decompresses faster than the disk reads it, files are
+    several times smaller) and pickle protocol 5. Creates the target folder if needed.
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(model, output_path, compress=("lz4", 3), protocol=5)
+
+def churn_model_train(X: pd.DataFrame, y: pd.Series, output_path: str = "models/churn_hgb.joblib") -> Tuple[object, dict]:
+    """
+    Train a histogram gradient-boosting classifier for churn prediction.
+    Features are pre-binned into uint8 histograms, so training is much faster and lighter
+    than an exact-split RandomForest. Returns (model, metrics).
     """
     X_train, X_val, y_train, y_val = train_test_split(X, y, test_size=0.2, random_state=42)
-    m = RandomForestClassifier(n_estimators=200, max_depth=8, random_state=42, n_jobs=-1)
+    m = HistGradientBoostingClassifier(max_iter=200, max_depth=8, early_stopping=True,
+                                       validation_fraction=0.1, random_state=42)
     m.fit(X_train, y_train)
     preds = m.predict_proba(X_val)[:, 1]
     auc = roc_auc_score(y_val, preds)
-    joblib.dump(m, output_path)
+    _save_model(m, output_path)
     return m, {"auc": float(auc)}
 
-def ltv_model_train(X: pd.DataFrame, y: pd.Series, output_path: str = "models/ltv_rf.joblib") -> Tuple[object, dict]:
+def ltv_model_train(X: pd.DataFrame, y: pd.Series, output_path: str = "models/ltv_hgb.joblib") -> Tuple[object, dict]:
     X_train, X_val, y_train, y_val = train_test_split(X, y, test_size=0.2, random_state=42)
-    m = RandomForestRegressor(n_estimators=200, max_depth=10, random_state=42, n_jobs=-1)
+    # poisson suits skewed, non-negative LTV; net-revenue targets can go negative
+    loss = "poisson" if (y_train >= 0).all() and y_train.sum() > 0 else "squared_error"
+    m = HistGradientBoostingRegressor(loss=loss, max_iter=200, max_depth=10, early_stopping=True,
+                                      validation_fraction=0.1, random_state=42)
     m.fit(X_train, y_train)
     preds = m.predict(X_val)
     rmse = mean_squared_error(y_val, preds, squared=False)
-    joblib.dump(m, output_path)
+    _save_model(m, output_path)
     return m, {"rmse": float(rmse)}
@@ -5,17 +5,72 @@ Utility functions: feature engineering, common checks, SQL loader skeleton.
 """
 
 import pandas as pd
-from typing import List
+from collections import namedtuple
+from typing import List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# timestamp layout handled by the Arrow fast path in ensure_datetime
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Heuristically detected column names for a table; fields are None when no column matches.
+SchemaHints = namedtuple("SchemaHints", ["ts", "player", "stake", "profit", "amount", "experiment"])
+
+
+def _first(cols: Sequence[str], low: Sequence[str], needles: Sequence[str]) -> Optional[str]:
+    """
+    Return the first column whose lower-cased name contains any of the needles.
+    """
+    for col, name in zip(cols, low):
+        if any(n in name for n in needles):
+            return col
+    return None
+
+
+def infer_hints(cols: Sequence[str]) -> SchemaHints:
+    """
+    Detect timestamp / player / money columns once per table so dashboards don't rescan columns.
+    """
+    cols = list(cols)
+    low = [c.lower() for c in cols]
+    return SchemaHints(
+        ts=_first(cols, low, ("date", "time")),
+        player=_first(cols, low, ("player", "user")),
+        stake=_first(cols, low, ("stake", "amount", "wager")),
+        profit=_first(cols, low, ("profit", "win", "pnl")),
+        amount=_first(cols, low, ("amount", "value", "wager")),
+        experiment=_first(cols, low, ("experiment", "exp_id")),
+    )
+
 
 def ensure_datetime(df: pd.DataFrame, col_candidates: List[str]) -> str:
     """
     Given df and a list of possible column names, find a datetime column and convert it.
+    Strict ISO-8601 strings are parsed by Arrow's vectorized strptime, other ISO-8601 layouts by
+    pd.to_datetime(format="ISO8601", cache=True), which parses each distinct string once; non-ISO
+    columns (e.g. "01/02/2023 10:00") fall back to pandas' format inference.
     Returns the selected column name or raises.
     """
     for c in col_candidates:
-        if c in df.columns:
-            df[c] = pd.to_datetime(df[c], errors="coerce")
+        if c not in df.columns:
+            continue
+        if pd.api.types.is_datetime64_any_dtype(df[c]):
             return c
+        if pa is not None:
+            parsed = pc.strptime(pa.array(df[c].astype(str)), format=ISO_FORMAT, unit="ns", error_is_null=True)
+            # only keep the fast path if it parsed every non-missing value
+            if parsed.null_count == df[c].isna().sum():
+                df[c] = parsed.to_numpy(zero_copy_only=False)
+                return c
+        parsed = pd.to_datetime(df[c], format="ISO8601", cache=True, errors="coerce")
+        if parsed.isna().sum() > df[c].isna().sum():
+            parsed = pd.to_datetime(df[c], cache=True, errors="coerce")
+        df[c] = parsed
+        return c
     raise ValueError("No datetime column found among candidates: " + ", ".join(col_candidates))
 
 def top_n_players_by_wager(transactions: pd.DataFrame, player_col: str, amount_col: str, n: int = 20):
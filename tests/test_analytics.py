@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src import analytics
+
+
+@pytest.mark.parametrize("accumulate", [analytics._accumulate_stakes, analytics._accumulate_stakes_py])
+def test_player_stake_stats_ignores_missing_stakes(monkeypatch, accumulate):
+    monkeypatch.setattr(analytics, "_accumulate_stakes", accumulate)
+    batches = [
+        pa.record_batch({"player_id": ["a", "b"], "stake": [3.0, 1.0]}),
+        pa.record_batch({"player_id": ["a", None], "stake": [None, 5.0]}),
+    ]
+    stats = analytics._player_stake_stats(batches, "player_id", "stake")
+    assert stats.loc["a", "count"] == 2
+    assert stats.loc["a", "n_stake"] == 1
+    assert stats.loc["a", "sum"] / stats.loc["a", "n_stake"] == 3.0
+    np.testing.assert_allclose(stats.loc["b"].to_numpy(), [1, 1, 1.0, 1.0])
+
+
+@pytest.mark.skipif(analytics.pl is None, reason="polars is not installed")
+def test_race_leaderboard_polars_matches_pandas(monkeypatch):
+    frames = [
+        pd.DataFrame({"player_id": ["a", None, "b", None], "stake": [2.0, 50.0, 1.0, 100.0]}),
+        pd.DataFrame({"player_id": ["b", "c", None], "stake": [4.0, 3.0, 7.0]}),
+    ]
+    frames = [f.astype({"player_id": "category"}) for f in frames]
+    with_polars = analytics._race_leaderboard(iter(frames), "player_id", "stake", "total_wager", 5)
+    monkeypatch.setattr(analytics, "pl", None)
+    with_pandas = analytics._race_leaderboard(iter(frames), "player_id", "stake", "total_wager", 5)
+
+    assert with_polars["player_id"].astype(str).tolist() == ["b", "c", "a"]
+    assert with_pandas["player_id"].astype(str).tolist() == ["b", "c", "a"]
+    assert with_polars["total_wager"].tolist() == with_pandas["total_wager"].tolist() == [5.0, 3.0, 2.0]
@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+
+import data_loader
+
+
+@pytest.fixture
+def dataset(tmp_path, monkeypatch):
+    """
+    A small dataset folder with a timestamped bets table, isolated from data/raw.
+    """
+    monkeypatch.setattr(data_loader, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(data_loader, "CACHE_DIR", tmp_path / ".cache")
+    folder = tmp_path / "casino"
+    folder.mkdir()
+    times = pd.date_range("2023-01-20", "2023-02-10", freq="6h")
+    pd.DataFrame({
+        "player_id": [f"p{i % 7}" for i in range(len(times))],
+        "bet_time": times.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stake_amount": [float(i % 5) for i in range(len(times))],
+    }).to_csv(folder / "bets.csv", index=False)
+    return folder
+
+
+def test_iter_frames_streams_every_row(dataset):
+    view = data_loader.load_view("bets.csv", dataset)
+    frames = list(view.iter_frames(["player_id", "stake_amount"], batch_size=16))
+    assert len(frames) > 1
+    df = pd.concat(frames)
+    assert len(df) == view.num_rows
+    assert list(df.columns) == ["player_id", "stake_amount"]
+    assert isinstance(frames[0]["player_id"].dtype, pd.CategoricalDtype)
+
+
+def test_iter_window_keeps_the_last_days(dataset):
+    view = data_loader.load_view("bets.csv", dataset)
+    df = pd.concat(view.iter_window(["player_id"], "bet_time", days=7, batch_size=16))
+    ts = pd.to_datetime(df["bet_time"])
+    assert ts.max() == pd.Timestamp("2023-02-10")
+    assert ts.min() == pd.Timestamp("2023-02-03")
+    assert len(df) == 29
+
+
+def test_list_dataset_files_matches_glob(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, "CACHE_DIR", tmp_path / ".cache")
+    for name in ["a.csv", ".hidden.csv", ".h/c.csv", "sub/b.csv", "sub/notes.txt", ".cache/a.parquet"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("x\n")
+    (tmp_path / "link.csv").symlink_to(tmp_path / "sub" / "b.csv")
+
+    files = sorted(data_loader.list_dataset_files(tmp_path, "**/*.csv"))
+    assert files == sorted([".h/c.csv", ".hidden.csv", "a.csv", "link.csv", "sub/b.csv"])
+    assert sorted(data_loader.list_dataset_files(tmp_path, "*.csv")) == [".hidden.csv", "a.csv", "link.csv"]
+
+
+def test_loaded_integer_columns_support_arithmetic(dataset):
+    pd.DataFrame({"player_id": [1, 2], "stake": [10, 50], "payout": [0, 120]}).to_csv(dataset / "rounds.csv", index=False)
+    df = data_loader.load_table("rounds.csv", dataset)
+    assert (df["stake"] - df["payout"]).tolist() == [10, -70]
+    assert (df["stake"] * df["stake"]).tolist() == [100, 2500]
+    assert isinstance(df["player_id"].dtype, pd.CategoricalDtype)
+
+
+@pytest.mark.parametrize("with_time", [False, True])
+def test_cache_build_survives_late_type_changes(dataset, monkeypatch, with_time):
+    # one tiny CSV block per read, so the empty first rows fix bonus_code's type as null
+    options = data_loader._csv_options()
+    options["read_options"].block_size = 1 << 10
+    monkeypatch.setattr(data_loader, "_csv_options", lambda: options)
+    rows = 500
+    df = pd.DataFrame({"player_id": [f"p{i % 3}" for i in range(rows)], "bonus_code": [None] * (rows - 1) + ["WELCOME"]})
+    if with_time:
+        df["bet_time"] = pd.date_range("2023-01-01", periods=rows, freq="h").strftime("%Y-%m-%dT%H:%M:%S")
+    df.to_csv(dataset / "bonuses.csv", index=False)
+
+    loaded = data_loader.load_table("bonuses.csv", dataset)
+    assert len(loaded) == rows
+    assert loaded["bonus_code"].dropna().tolist() == ["WELCOME"]
+    assert not list(data_loader.CACHE_DIR.glob("*.tmp"))
+
+
+def test_partitioned_cache_reads_back_in_time_order(dataset):
+    times = pd.date_range("2023-01-01", "2023-12-31", freq="D")
+    pd.DataFrame({
+        "player_id": ["p1"] * len(times),
+        "bet_time": times.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stake_amount": 1.0,
+    }).to_csv(dataset / "year.csv", index=False)
+    df = data_loader.load_table("year.csv", dataset)
+    assert len(df) == len(times)
+    assert df["bet_time"].is_monotonic_increasing
+
+
+def test_list_dataset_files_skips_unreadable_directories(tmp_path, monkeypatch):
+    for name in ["a.csv", "locked/b.csv"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("x\n")
+    scandir = data_loader.os.scandir
+
+    def guarded_scandir(path):
+        if str(path).endswith("locked"):
+            raise PermissionError(13, "Permission denied", str(path))
+        return scandir(path)
+
+    # chmod is ignored when the tests run as root, so deny the read in scandir itself
+    monkeypatch.setattr(data_loader.os, "scandir", guarded_scandir)
+    assert data_loader.list_dataset_files(tmp_path, "**/*.csv") == ["a.csv"]
@@ -0,0 +1,17 @@
+import pandas as pd
+
+from src.utils import ensure_datetime
+
+
+def test_ensure_datetime_parses_iso_strings():
+    df = pd.DataFrame({"ts": ["2023-01-02T10:00:00", "2023-01-03T11:30:00", None]})
+    assert ensure_datetime(df, ["missing", "ts"]) == "ts"
+    assert df["ts"].iloc[0] == pd.Timestamp("2023-01-02 10:00")
+    assert df["ts"].isna().sum() == 1
+
+
+def test_ensure_datetime_infers_non_iso_formats():
+    df = pd.DataFrame({"ts": ["01/02/2023 10:00", "01/03/2023 11:30"]})
+    ensure_datetime(df, ["ts"])
+    assert df["ts"].notna().all()
+    assert df["ts"].iloc[1] == pd.Timestamp("2023-01-03 11:30")